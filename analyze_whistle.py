@@ -1,48 +1,42 @@
+import mmap
 import numpy as np
-import struct
+
+# Binary STL triangle record: normal, three vertices, attribute byte count
+# Coordinates are float32 on disk and are kept as float32 throughout the analysis
+STL_DTYPE = np.dtype([('n', '<f4', 3), ('v', '<f4', (3, 3)), ('attr', '<u2')])
 
 def read_binary_stl(filename):
-    """Read a binary STL file and extract vertices."""
+    """Read a binary STL file and extract vertices as separate X, Y and Z arrays."""
+    # Map the file rather than reading it, so the triangle array is a view onto the page cache
     with open(filename, 'rb') as f:
-        # Read header (80 bytes)
-        header = f.read(80)
-
-        # Read number of triangles
-        num_triangles = struct.unpack('I', f.read(4))[0]
-
-        print(f"STL File: {filename}")
-        print(f"Header: {header.decode('ascii', errors='ignore').strip()}")
-        print(f"Number of triangles: {num_triangles}")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
-        vertices = []
-        normals = []
+    # Header (80 bytes) followed by the number of triangles
+    header = mm[:80]
+    num_triangles = int.from_bytes(mm[80:84], 'little')
 
-        for i in range(num_triangles):
-            # Normal vector (3 floats)
-            normal = struct.unpack('fff', f.read(12))
-            normals.append(normal)
+    print(f"STL File: {filename}")
+    print(f"Header: {header.decode('ascii', errors='ignore').strip()}")
+    print(f"Number of triangles: {num_triangles}")
 
-            # Three vertices (3 * 3 floats)
-            v1 = struct.unpack('fff', f.read(12))
-            v2 = struct.unpack('fff', f.read(12))
-            v3 = struct.unpack('fff', f.read(12))
+    # Parse all triangle records in one go rather than unpacking each one
+    triangles = np.frombuffer(mm, dtype=STL_DTYPE, count=num_triangles, offset=84)
 
-            vertices.extend([v1, v2, v3])
+    # Split the vertex coordinates into one contiguous array per axis
+    vertices = triangles['v']
+    xs, ys, zs = (vertices[..., axis].ravel() for axis in range(3))
 
-            # Attribute byte count (usually 0)
-            f.read(2)
-
-        return np.array(vertices), np.array(normals)
+    return (xs, ys, zs), triangles['n']
 
 # Analyze the whistle geometry
-vertices, normals = read_binary_stl('whistle.stl')
+(xs, ys, zs), normals = read_binary_stl('whistle.stl')
 
-print(f"\nTotal vertices: {len(vertices)}")
+print(f"\nTotal vertices: {len(xs)}")
 print(f"Total normals: {len(normals)}")
 
 # Get bounding box
-min_coords = vertices.min(axis=0)
-max_coords = vertices.max(axis=0)
+min_coords = np.array([xs.min(), ys.min(), zs.min()], dtype=np.float32)
+max_coords = np.array([xs.max(), ys.max(), zs.max()], dtype=np.float32)
 dimensions = max_coords - min_coords
 
 print(f"\nBounding Box:")
@@ -54,10 +48,20 @@ print(f"  Depth (Y): {dimensions[1]:.2f} mm")
 print(f"  Height (Z): {dimensions[2]:.2f} mm")
 
 # Find unique Z levels to identify key features
-z_coords = vertices[:, 2]
-unique_z = np.unique(np.round(z_coords, 2))
-
-print(f"\nUnique Z levels: {len(unique_z)}")
+# Z is bucketed to 0.01 mm and marked in a table spanning the bounding box, which avoids sorting every vertex
+# Meshes too tall for a reasonably sized table (e.g. modelled in µm) fall back to sorting with np.unique
+MAX_Z_BUCKETS = 10_000_000
+z_buckets = np.rint(zs.astype(np.float64) * 100).astype(np.int64)
+z_bucket_min = int(z_buckets.min())
+z_bucket_span = int(z_buckets.max()) - z_bucket_min + 1
+if z_bucket_span <= MAX_Z_BUCKETS:
+    z_bucket_seen = np.zeros(z_bucket_span, dtype=bool)
+    z_bucket_seen[z_buckets - z_bucket_min] = True
+    unique_z_count = np.count_nonzero(z_bucket_seen)
+else:
+    unique_z_count = len(np.unique(z_buckets))
+
+print(f"\nUnique Z levels: {unique_z_count}")
 
 # Analyze throat geometry - look for vertices in the middle section
 # The throat is typically where air is compressed before exiting
@@ -65,16 +69,18 @@ middle_z = (min_coords[2] + max_coords[2]) / 2
 
 # Get vertices near the middle
 tolerance = dimensions[2] * 0.2
-middle_vertices = vertices[np.abs(vertices[:, 2] - middle_z) < tolerance]
+middle_mask = np.abs(zs - middle_z) < tolerance
+middle_xs = xs[middle_mask]
+middle_ys = ys[middle_mask]
 
 print(f"\nMiddle section analysis (Z ≈ {middle_z:.2f}):")
-print(f"  Number of vertices: {len(middle_vertices)}")
+print(f"  Number of vertices: {len(middle_xs)}")
 
-if len(middle_vertices) > 0:
+if len(middle_xs) > 0:
     # Find the throat opening (smallest cross-section)
     # This is typically the narrowest part in X or Y
-    middle_x_range = middle_vertices[:, 0].max() - middle_vertices[:, 0].min()
-    middle_y_range = middle_vertices[:, 1].max() - middle_vertices[:, 1].min()
+    middle_x_range = middle_xs.max() - middle_xs.min()
+    middle_y_range = middle_ys.max() - middle_ys.min()
 
     print(f"  X range: {middle_x_range:.2f} mm")
     print(f"  Y range: {middle_y_range:.2f} mm")
@@ -87,20 +93,20 @@ for i in range(min(5, len(normals))):
     angle_from_z = np.degrees(np.arccos(abs(normals[i][2])))
     print(f"    Normal {i}: {normals[i]}, Angle from Z-axis: {angle_from_z:.1f}°")
 
-# Find vertices with specific Y coordinates (front/back of whistle)
-front_vertices = vertices[vertices[:, 1] == vertices[:, 1].max()]
-back_vertices = vertices[vertices[:, 1] == vertices[:, 1].min()]
+# Count vertices with specific Y coordinates (front/back of whistle), reusing the bounding box extremes
+front_vertex_count = np.count_nonzero(ys == max_coords[1])
+back_vertex_count = np.count_nonzero(ys == min_coords[1])
 
-print(f"\nFront section (max Y): {len(front_vertices)} vertices")
-print(f"Back section (min Y): {len(back_vertices)} vertices")
+print(f"\nFront section (max Y): {front_vertex_count} vertices")
+print(f"Back section (min Y): {back_vertex_count} vertices")
 
 # Analyze the mouth opening (entrance for air)
 # Typically at one end
-bottom_vertices = vertices[np.abs(vertices[:, 2] - min_coords[2]) < 0.5]
-top_vertices = vertices[np.abs(vertices[:, 2] - max_coords[2]) < 0.5]
+bottom_vertex_count = np.count_nonzero(np.abs(zs - min_coords[2]) < 0.5)
+top_vertex_count = np.count_nonzero(np.abs(zs - max_coords[2]) < 0.5)
 
-print(f"\nBottom vertices (mouth area): {len(bottom_vertices)}")
-print(f"Top vertices: {len(top_vertices)}")
+print(f"\nBottom vertices (mouth area): {bottom_vertex_count}")
+print(f"Top vertices: {top_vertex_count}")
 
 # Estimate throat angle by looking at vertices that form the ramp
 # The whistle works by having air flow over an angled edge
@@ -115,12 +121,12 @@ print(f"  Estimated throat height: {dimensions[2] * 0.4:.2f} mm")
 print(f"\nSearching for throat angle...")
 
 # Group vertices by Z level and analyze Y positions
-z_levels = np.linspace(min_coords[2], max_coords[2], 20)
+z_levels = np.linspace(min_coords[2], max_coords[2], 20, dtype=np.float32)  # match the float32 vertex data
 for i, z in enumerate(z_levels[5:15]):  # Check middle section
-    level_verts = vertices[np.abs(vertices[:, 2] - z) < 0.5]
-    if len(level_verts) > 0:
-        y_min = level_verts[:, 1].min()
-        y_max = level_verts[:, 1].max()
+    level_ys = ys[np.abs(zs - z) < 0.5]
+    if len(level_ys) > 0:
+        y_min = level_ys.min()
+        y_max = level_ys.max()
         if i == 0:
             prev_y_min = y_min
         else:
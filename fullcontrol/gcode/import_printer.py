@@ -1,10 +1,10 @@
 
 import json
-import os
 from copy import deepcopy
 from fullcontrol.gcode import Extruder, ManualGcode, Buildplate, Hotend, Fan
 import fullcontrol.devices.community.singletool.base_settings as base_settings
 from importlib import import_module, resources
+from functools import lru_cache
 
 
 def load_json(library, file_name):
@@ -12,6 +12,11 @@ def load_json(library, file_name):
     with resource.open('r') as file:
         return json.load(file)
 
+@lru_cache(maxsize=None)
+def load_library(library_name):
+    ' parse library.json once per process and reuse it for later designs - the returned dict is shared so must not be modified'
+    return load_json(library_name, 'library.json')
+
 def find_terms_in_brackets(input_string):
     import re
     ' find all terms in the start_gcode string contained within {} and split the terms if they are comma separated'
@@ -36,8 +41,9 @@ def replace_gcode_variables(printer_name: str, gcode_type: str, data: dict):
 def import_printer(printer_name: str, user_overrides: dict):
     library_name = 'cura' if printer_name[:5] == 'Cura/' else 'community_minimal'
     printer_name = printer_name[5:] if library_name == 'cura' else printer_name[10:]
-    library = load_json(library_name, os.path.join('library.json'))
-    data = import_module(f'fullcontrol.devices.{library_name}.settings.{library[printer_name]}').default_initial_settings
+    library = load_library(library_name)
+    # copy the module-level settings so the unit conversion below doesn't change them for later designs
+    data = deepcopy(import_module(f'fullcontrol.devices.{library_name}.settings.{library[printer_name]}').default_initial_settings)
     if library_name == 'cura':
         data['print_speed'] = int(data['print_speed']*60)
         data['travel_speed'] = int(data['travel_speed']*60)
@@ -0,0 +1,22 @@
+import os, re, sys
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # test this copy of fullcontrol
+import fullcontrol as fc
+
+
+# usage: run this script in the tests directory with 'python import_printer_test.py' (it is also picked up by pytest)
+# it checks that generating gcode for a library printer doesn't change that printer's default settings for later designs
+# (import_printer converts the cura speeds from mm/s to mm/min, which used to happen in place on the settings module)
+
+def feedrates(gcode):
+    return re.findall(r' F(\d+)', gcode)
+
+def test_repeated_cura_transforms_keep_feedrates():
+    steps = [fc.Point(x=0, y=0, z=0.2), fc.Point(x=10, y=0, z=0.2), fc.Point(x=10, y=10, z=0.2)]
+    first = fc.transform(steps, 'gcode', fc.GcodeControls(printer_name='Cura/101Hero'), show_tips=False)
+    second = fc.transform(steps, 'gcode', fc.GcodeControls(printer_name='Cura/101Hero'), show_tips=False)
+    assert feedrates(first), 'no feedrates found in the gcode'
+    assert feedrates(first) == feedrates(second), f'feedrates changed between transforms: {feedrates(first)} -> {feedrates(second)}'
+
+if __name__ == '__main__':
+    test_repeated_cura_transforms_keep_feedrates()
+    print('great! repeated gcode transforms with the same Cura printer give the same feedrates.')
@@ -2,10 +2,18 @@
 Cylindrical Whistle Keychain Design using FullControl
 Based on analysis of ultra-compact whistle geometry
 Key feature: 75° angled throat for whistle tone generation
+
+Generates gcode by default; run with --plot to also show the 3D preview
 """
 
+import sys
 import fullcontrol as fc
-from math import tau, cos, sin, radians
+import numpy as np
+from functools import lru_cache
+from math import tau, radians  # scalar constants only - all trig on coordinates goes through numpy
+
+# Only build the (slow) 3D tube preview when asked for
+show_preview = '--plot' in sys.argv
 
 # Design parameters
 cylinder_diameter = 12  # Main body diameter (mm)
@@ -21,8 +29,108 @@ whistle_mouth_height = 2  # Height of air intake (mm)
 throat_depth = 8  # Depth of throat channel (mm)
 resonator_length = 12  # Length of resonating chamber (mm)
 
-# Build the design
-steps = []
+# Fixed angles (radians) used inside the layer loops
+keyring_gap_angle = radians(45)  # Opening for keyring
+throat_start_angle = radians(-15)  # Start of throat opening
+throat_end_angle = radians(15)  # End of throat opening
+# Cylinder wall around the throat opening
+throat_arc_angle = tau - (throat_end_angle - throat_start_angle)
+outlet_start_angle = radians(30)  # Start of the partial circle around the air outlet
+
+
+def layer_zs(first_z, layers):
+    """Return the z-position of each of a section's layers, starting at first_z."""
+    return first_z + np.arange(layers) * layer_height
+
+
+def stack_layers(xs, ys, zs):
+    """Return a float32 array of shape (layers, points, 3) repeating an XY profile at each z in zs.
+
+    xs and ys may be a single profile of shape (points,) or one profile per layer.
+    """
+    xs, ys = np.broadcast_arrays(xs, ys)
+    layers = np.empty((len(zs), xs.shape[-1], 3), dtype=np.float32)
+    layers[..., 0] = xs
+    layers[..., 1] = ys
+    layers[..., 2] = np.reshape(zs, (-1, 1))
+    return layers
+
+
+@lru_cache(maxsize=16)
+def arc_table(start_angle, arc_angle, segments):
+    """Return the read-only float32 (segments+1, 2) table of cos/sin for a unit arc.
+
+    The angles are the same as fc.arcXY's.
+    """
+    # fc.arcXY spaces its angles with fc.linspace
+    end_angle = start_angle + arc_angle
+    angles = start_angle + np.arange(segments + 1) / segments * (end_angle - start_angle)
+    table = np.stack([np.cos(angles), np.sin(angles)], axis=1).astype(np.float32)
+    table.flags.writeable = False  # shared between callers
+    return table
+
+
+def arc_layers(zs, radius, start_angle, arc_angle, segments, centre_x=0, centre_y=0):
+    """Return an array of shape (layers, segments+1, 3) holding an XY arc at each z in zs.
+
+    Equivalent to calling fc.arcXY once per layer, but the unit arc for each
+    (start_angle, arc_angle, segments) is computed once and scaled for every layer and call.
+    radius may be a scalar or one value per layer.
+    """
+    table = arc_table(start_angle, arc_angle, segments)
+    radius = np.asarray(radius, dtype=np.float32).reshape(-1, 1)
+    return stack_layers(centre_x + radius * table[:, 0], centre_y + radius * table[:, 1], zs)
+
+
+def circle_layers(zs, radius, segments, centre_x=0, centre_y=0):
+    """Return an array of shape (layers, segments+1, 3) holding a closed XY circle at each z in zs.
+
+    The circle starts at angle 0.
+    """
+    return arc_layers(zs, radius, 0, tau, segments, centre_x, centre_y)
+
+
+# Kinds of entry in the design buffer
+PRINT = 0  # print to this point
+# travel to this point with the extruder off, then turn it on and start printing from here
+TRAVEL = 1
+
+
+def paths_to_design(paths):
+    """Pack a list of (N, 3) path arrays into one coordinate buffer and a parallel array of kinds.
+
+    Each path is reached by a travel move to its first point.
+    """
+    coords = np.concatenate(paths)
+    kinds = np.full(len(coords), PRINT, dtype=np.uint8)
+    kinds[np.cumsum([0] + [len(path) for path in paths[:-1]])] = TRAVEL
+    return coords, kinds
+
+
+def design_to_steps(coords, kinds):
+    """Convert the design buffer to a list of fullcontrol steps, allocated once at its final size.
+
+    Coordinates are widened from float32 to Python floats only here, when each fc.Point is
+    created.
+
+    A TRAVEL entry becomes the same Extruder(off) / point / Extruder(on) sequence as fc.travel_to,
+    followed by the point itself as the start of the printed path.
+    """
+    steps = [None] * (len(coords) + 3 * int(np.count_nonzero(kinds == TRAVEL)))
+    i = 0
+    for (x, y, z), kind in zip(coords.tolist(), kinds.tolist()):
+        point = fc.Point(x=x, y=y, z=z)
+        if kind == TRAVEL:
+            steps[i:i + 3] = fc.Extruder(on=False), point, fc.Extruder(on=True)
+            i += 3
+        steps[i] = point
+        i += 1
+    return steps
+
+
+# Build the design as a list of paths (float32 arrays of XYZ coordinates)
+# Each path is printed after a travel move to its first point
+paths = []
 
 # Starting point
 start_z = 0.2
@@ -30,201 +138,119 @@ start_z = 0.2
 # Section 1: Base with keyring hole (first 8mm)
 print("Creating base section with keyring hole...")
 keyring_section_length = 8
-
-for layer in range(int(keyring_section_length / layer_height)):
-    z = start_z + layer * layer_height
-
-    # Create outer cylinder
-    outer_circle = fc.circleXY(
-        centre=fc.Point(x=0, y=0, z=z),
-        radius=cylinder_radius,
-        start_angle=0,
-        segments=64
-    )
-
-    # Create keyring hole (elliptical opening in first few layers)
-    if layer < int(keyring_hole_diameter / layer_height):
-        # Add a travel move to skip the keyring hole area
-        hole_radius = keyring_hole_diameter / 2
-
-        # Split the circle to create an opening
-        # Print outer ring with gap for keyring
-        angle_gap = radians(45)  # Opening for keyring
-
-        # Print arc from angle_gap to 2*pi - angle_gap
-        partial_circle = fc.arcXY(
-            centre=fc.Point(x=0, y=cylinder_radius + 2, z=z),
-            radius=cylinder_radius,
-            start_angle=angle_gap,
-            arc_angle=tau - 2*angle_gap,
-            segments=60
-        )
-        steps.extend(fc.travel_to(partial_circle[0]))
-        steps.extend(partial_circle)
-    else:
-        # Solid cylinder
-        steps.extend(fc.travel_to(outer_circle[0]))
-        steps.extend(outer_circle)
+keyring_layers = int(keyring_section_length / layer_height)
+keyring_zs = layer_zs(start_z, keyring_layers)
+keyring_hole_layers = int(keyring_hole_diameter / layer_height)
+
+# Create keyring hole (elliptical opening in first few layers)
+# Split the circle to create an opening
+# Print outer ring with gap for keyring,
+# as an arc from keyring_gap_angle to 2*pi - keyring_gap_angle
+paths.extend(arc_layers(
+    keyring_zs[:keyring_hole_layers],
+    radius=cylinder_radius,
+    start_angle=keyring_gap_angle,
+    arc_angle=tau - 2*keyring_gap_angle,
+    segments=60,
+    centre_y=cylinder_radius + 2
+))
+# Solid cylinder for the rest of the section
+paths.extend(circle_layers(keyring_zs[keyring_hole_layers:], cylinder_radius, 64))
 
 # Section 2: Transition to whistle throat (next 4mm)
 print("Creating transition section...")
 transition_length = 4
 transition_layers = int(transition_length / layer_height)
 
-for layer in range(transition_layers):
-    z = start_z + keyring_section_length + layer * layer_height
-
-    # Solid cylinder
-    outer_circle = fc.circleXY(
-        centre=fc.Point(x=0, y=0, z=z),
-        radius=cylinder_radius,
-        start_angle=0,
-        segments=64
-    )
-    steps.extend(fc.travel_to(outer_circle[0]))
-    steps.extend(outer_circle)
+# Solid cylinder
+transition_zs = layer_zs(start_z + keyring_section_length, transition_layers)
+paths.extend(circle_layers(transition_zs, cylinder_radius, 64))
 
 # Section 3: Whistle throat with angled ramp (critical section!)
 print("Creating whistle throat with 75° angled ramp...")
 throat_section_start = keyring_section_length + transition_length
 throat_layers = int(throat_depth / layer_height)
+throat_zs = layer_zs(start_z + throat_section_start, throat_layers)
 
 # The throat is the key feature - air flows over an angled surface
 # We'll create a cylinder with an internal angled ramp
 
-for layer in range(throat_layers):
-    z = start_z + throat_section_start + layer * layer_height
-
-    # Calculate the ramp position (moves forward as we go up)
-    # tan(75°) ≈ 3.73, but we use the complementary angle for the slope
-    ramp_offset = layer * layer_height / radians(throat_angle)
-
-    # Create outer cylinder
-    outer_circle = fc.circleXY(
-        centre=fc.Point(x=0, y=0, z=z),
-        radius=cylinder_radius,
-        start_angle=0,
-        segments=64
-    )
-
-    # Create the throat opening (front side)
-    # We'll create a partial circle that excludes the throat area
-    # The throat is a slot that directs air
-
-    # Define throat boundaries (angular range to exclude)
-    throat_start_angle = radians(-15)  # Start of throat opening
-    throat_end_angle = radians(15)     # End of throat opening
-
-    # Print the cylinder except for the throat opening area
-    # First arc: from end of throat to start of throat (most of circle)
-    main_arc = fc.arcXY(
-        centre=fc.Point(x=0, y=0, z=z),
-        radius=cylinder_radius,
-        start_angle=throat_end_angle,
-        arc_angle=tau - (throat_end_angle - throat_start_angle),
-        segments=60
-    )
-
-    steps.extend(fc.travel_to(main_arc[0]))
-    steps.extend(main_arc)
-
-    # Add the angled ramp surface (this creates the whistle tone!)
-    # The ramp is a sloped surface that starts low and goes high
-    if layer < throat_layers * 0.7:  # Only in lower part of throat
-        ramp_points = []
-        ramp_y_start = -cylinder_radius * 0.5
-        ramp_y_end = -cylinder_radius * 0.2
-
-        # Create angled ramp from back of throat
-        for i in range(10):
-            t = i / 9
-            x = (1 - t) * cylinder_radius * sin(throat_start_angle) + t * cylinder_radius * sin(throat_end_angle)
-            y = ramp_y_start + (ramp_y_end - ramp_y_start) * t
-            ramp_points.append(fc.Point(x=x, y=y, z=z))
-
-        if len(ramp_points) > 0:
-            steps.extend(fc.travel_to(ramp_points[0]))
-            steps.extend(ramp_points)
+# Create the throat opening (front side)
+# We'll create a partial circle that excludes the throat area
+# (throat_start_angle to throat_end_angle)
+# The throat is a slot that directs air
+# Print the cylinder except for the throat opening area:
+# an arc from end of throat to start of throat (most of circle)
+throat_arcs = arc_layers(throat_zs, cylinder_radius, throat_end_angle, throat_arc_angle, 60)
+
+# The angled ramp runs from the back of the throat and has the same XY profile in every layer
+ramp_y_start = -cylinder_radius * 0.5
+ramp_y_end = -cylinder_radius * 0.2
+ramp_t = np.arange(10) / 9
+ramp_x_start, ramp_x_end = cylinder_radius * np.sin([throat_start_angle, throat_end_angle])
+ramp_xs = (1 - ramp_t) * ramp_x_start + ramp_t * ramp_x_end
+ramp_ys = ramp_y_start + (ramp_y_end - ramp_y_start) * ramp_t
+# Add the angled ramp surface (this creates the whistle tone!)
+# The ramp is a sloped surface that starts low and goes high
+# Only in lower part of throat
+ramp_zs = throat_zs[np.arange(throat_layers) < throat_layers * 0.7]
+throat_ramps = stack_layers(ramp_xs, ramp_ys, ramp_zs)
+
+# Each layer prints its arc and then, in the lower part, its ramp
+for arc, ramp in zip(throat_arcs, throat_ramps):
+    paths.extend((arc, ramp))
+paths.extend(throat_arcs[len(throat_ramps):])
 
 # Section 4: Resonating chamber (next 12mm)
 print("Creating resonating chamber...")
 resonator_start = throat_section_start + throat_depth
 resonator_layers = int(resonator_length / layer_height)
+resonator_zs = layer_zs(start_z + resonator_start, resonator_layers)
+
+# Create cylinder with smaller internal diameter (resonating chamber)
+# The chamber amplifies the whistle tone
+resonator_rings = circle_layers(resonator_zs, cylinder_radius, 64)
+# Add infill pattern for resonating chamber walls
+# Multiple concentric circles for strength, every 5th layer
+reinforcement_rings = circle_layers(resonator_zs[::5], cylinder_radius * 0.6, 48)
 
 for layer in range(resonator_layers):
-    z = start_z + resonator_start + layer * layer_height
-
-    # Create cylinder with smaller internal diameter (resonating chamber)
-    # The chamber amplifies the whistle tone
-    outer_circle = fc.circleXY(
-        centre=fc.Point(x=0, y=0, z=z),
-        radius=cylinder_radius,
-        start_angle=0,
-        segments=64
-    )
-
-    # Add infill pattern for resonating chamber walls
-    # Multiple concentric circles for strength
+    paths.append(resonator_rings[layer])
     if layer % 5 == 0:  # Every 5th layer add reinforcement
-        inner_circle = fc.circleXY(
-            centre=fc.Point(x=0, y=0, z=z),
-            radius=cylinder_radius * 0.6,
-            start_angle=0,
-            segments=48
-        )
-        steps.extend(fc.travel_to(outer_circle[0]))
-        steps.extend(outer_circle)
-        steps.extend(fc.travel_to(inner_circle[0]))
-        steps.extend(inner_circle)
-    else:
-        steps.extend(fc.travel_to(outer_circle[0]))
-        steps.extend(outer_circle)
+        paths.append(reinforcement_rings[layer // 5])
 
 # Section 5: Exit end with air outlet (final section)
 print("Creating exit end with air outlet...")
 exit_section_length = total_length - (resonator_start + resonator_length)
 exit_layers = int(exit_section_length / layer_height)
 
-for layer in range(exit_layers):
-    z = start_z + resonator_start + resonator_length + layer * layer_height
-
-    # Tapered end for air exit
-    taper_factor = 1 - (layer / exit_layers) * 0.3  # Taper to 70% of original radius
-    current_radius = cylinder_radius * taper_factor
-
-    # Create outlet with small opening for sound
-    if layer < exit_layers * 0.8:
-        # Partial circle with outlet gap
-        outlet_circle = fc.arcXY(
-            centre=fc.Point(x=0, y=0, z=z),
-            radius=current_radius,
-            start_angle=radians(30),
-            arc_angle=tau * 0.85,
-            segments=50
-        )
-        steps.extend(fc.travel_to(outlet_circle[0]))
-        steps.extend(outlet_circle)
-    else:
-        # Close the top
-        full_circle = fc.circleXY(
-            centre=fc.Point(x=0, y=0, z=z),
-            radius=current_radius,
-            start_angle=0,
-            segments=50
-        )
-        steps.extend(fc.travel_to(full_circle[0]))
-        steps.extend(full_circle)
+# Tapered end for air exit - taper to 70% of original radius
+exit_zs = layer_zs(start_z + resonator_start + resonator_length, exit_layers)
+exit_radii = cylinder_radius * (1 - (np.arange(exit_layers) / exit_layers) * 0.3)
+outlet = np.arange(exit_layers) < exit_layers * 0.8
+
+# Create outlet with small opening for sound: partial circle with outlet gap
+paths.extend(arc_layers(exit_zs[outlet], exit_radii[outlet], outlet_start_angle, tau * 0.85, 50))
+# Close the top
+paths.extend(circle_layers(exit_zs[~outlet], exit_radii[~outlet], 50))
+
+coords, kinds = paths_to_design(paths)
+travel_count = int(np.count_nonzero(kinds == TRAVEL))
+steps = design_to_steps(coords, kinds)
 
 print(f"\nDesign complete!")
-print(f"Total layers: {len([s for s in steps if isinstance(s, fc.Point) and hasattr(s, 'z')])}")
+# Points in steps: each travel repeats its destination point
+print(f"Total layers: {len(coords) + travel_count}")
 print(f"Throat angle: {throat_angle}° (critical whistle parameter)")
 print(f"Overall dimensions: {cylinder_diameter}mm diameter × {total_length}mm length")
 
-# Transform to gcode and plot
-print("\nGenerating preview...")
-plot_data = fc.transform(steps, 'plot', fc.PlotControls(color_type='print_sequence', style='tube'))
+# Transform to gcode and, if requested, plot
+if show_preview:
+    print("\nGenerating preview...")
+    plot_controls = fc.PlotControls(color_type='print_sequence', style='tube')
+    plot_data = fc.transform(steps, 'plot', plot_controls)
 
-# Also generate gcode
+# Generate gcode
 print("\nGenerating gcode...")
 gcode = fc.transform(steps, 'gcode', fc.GcodeControls(
     printer_name='generic',